@@ -11,15 +11,25 @@ from __future__ import annotations
 
 # -------------- Standard Library ---------
 
+import copy
 import json
 import logging
+import math
+import os
+import queue
 import sqlite3
+import threading
 from contextlib import contextmanager
+from functools import partial, wraps
+from itertools import islice
 from pathlib import Path
-from typing import Generator
+from typing import Generator, Iterable, Iterator
 
 # ------------- Third Party Library ---------------
-# N/A for now
+
+import orjson
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
 
 # -------------- Application Imports --------------
 
@@ -34,6 +44,31 @@ logger = logging.getLogger(__name__)
 
 CURRENT_SCHEMA_VERSION = 1
 
+# Size of sqlite3's per-connection prepared statement cache
+_CACHED_STATEMENTS = 256
+
+# NumPy scalars/arrays (detector scores) and int dict keys encode like json.dumps
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# orjson only encodes ints in this range
+_ORJSON_INT_MIN = -(2 ** 63)
+_ORJSON_INT_MAX = 2 ** 64 - 1
+
+# Seconds to wait for a free pooled connection before giving up
+_POOL_TIMEOUT = 30.0
+
+# Counts/statistics may be served this many seconds stale
+_STATS_CACHE_TTL = 5.0
+
+# Applied once to every pooled connection
+_CONNECTION_PRAGMAS = (
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 1073741824", # 1 GiB
+    "PRAGMA cache_size = -65536", # 64 MiB
+    "PRAGMA busy_timeout = 5000", # ms
+    "PRAGMA analysis_limit = 400", # Bound the cost of PRAGMA optimize
+)
+
 # -------------- Schema Definiton ------------------
 
 """
@@ -72,18 +107,228 @@ CREATE TABLE IF NOT EXISTS schema_version (
 );
 
 CREATE INDEX IF NOT EXISTS idx_detections_pair_id ON detections(pair_id);
-CREATE INDEX IF NOT EXISTS idx_detections_signal_type ON detections(signal_type);
-CREATE INDEX IF NOT EXISTS idx_detections_severity ON detections(severity);
+
+-- Composite indexes match the filter + ORDER BY severity DESC of the
+-- signal/severity queries; they supersede the old single-column indexes.
+DROP INDEX IF EXISTS idx_detections_signal_type;
+DROP INDEX IF EXISTS idx_detections_severity;
+CREATE INDEX IF NOT EXISTS idx_detections_signal_sev ON detections(signal_type, severity DESC);
+CREATE INDEX IF NOT EXISTS idx_detections_sev_desc ON detections(severity DESC, pair_id);
 """
 
+# ---------------- SQL Statements ------------------------
+
+"""
+Query text lives in module-level constants so every call passes the identical
+string and hits sqlite3's per-connection prepared statement cache.
+"""
+_SQL_INSERT_SCHEMA_VERSION = "INSERT OR IGNORE INTO schema_version (version) VALUES (?)"
+_SQL_MAX_SCHEMA_VERSION = "SELECT MAX(version) FROM schema_version"
+# Refresh planner statistics where SQLite thinks they are stale or missing.
+# The 0x10000 bit (check every table, not just ones this connection queried)
+# needs SQLite >= 3.46 and is ignored by older versions.
+_SQL_OPTIMIZE = "PRAGMA optimize"
+_SQL_OPTIMIZE_ALL_TABLES = "PRAGMA optimize = 0x10002"
+
+_SQL_INSERT_PAIR = """
+INSERT INTO response_pairs (pair_id, chosen, rejected, source_dataset)
+VALUES (?, ?, ?, ?)
+"""
+_SQL_GET_PAIR = "SELECT * FROM response_pairs WHERE pair_id = ?"
+_SQL_GET_ALL_PAIR_IDS = "SELECT pair_id FROM response_pairs ORDER by created_at"
+_SQL_COUNT_PAIRS = "SELECT COUNT(*) FROM response_pairs"
+
+_SQL_INSERT_DETECTION = """
+INSERT INTO detections (pair_id, signal_type, severity, metadata)
+VALUES (?, ?, ?, ?)
+"""
+_SQL_GET_DETECTIONS_FOR_PAIR = """
+SELECT * FROM detections
+WHERE pair_id = ?
+ORDER BY severity DESC, detected_at
+"""
+_SQL_GET_DETECTIONS_BY_SIGNAL = """
+SELECT * FROM detections
+WHERE signal_type = ? AND severity >= ?
+ORDER BY severity DESC, detected_at
+"""
+_SQL_GET_HIGH_SEVERITY_DETECTIONS = """
+SELECT d.*, rp.chosen, rp.rejected
+FROM detections d
+JOIN response_pairs rp ON d.pair_id = rp.pair_id
+WHERE d.severity >= ?
+ORDER BY d.severity DESC, d.detected_at
+"""
+_SQL_COUNT_DETECTIONS_BY_SIGNAL = """
+SELECT signal_type, COUNT(*) as count
+FROM detections
+GROUP BY signal_type
+ORDER BY count DESC
+"""
+_SQL_DETECTION_STATISTICS = """
+SELECT
+    signal_type,
+    COUNT(*) as count,
+    AVG(severity) as avg_severity,
+    COUNT(CASE WHEN severity >= 0.9 THEN 1 END) as critical,
+    COUNT(CASE WHEN severity >= 0.7 AND severity < 0.9 THEN 1 END) as high,
+    COUNT(CASE WHEN severity >= 0.5 AND severity < 0.7 THEN 1 END) as medium,
+    COUNT(CASE WHEN severity < 0.5 THEN 1 END) as low
+FROM detections
+GROUP by signal_type
+"""
+
+_SQL_DELETE_DETECTIONS = "DELETE FROM detections"
+_SQL_DELETE_PAIRS = "DELETE FROM response_pairs"
+
 # ---------------- Connection Management -----------------------
 
+class ConnectionPool:
+    """
+    Thread-safe pool of reusable SQLite connections.
+
+    Connections are opened lazily up to ``max_size`` and handed back to the
+    pool instead of being closed, so repeated calls reuse warm connections
+    (and SQLite's page cache) instead of reconnecting every time.
+
+    The pool is fork-aware: SQLite connections must not cross a fork(), so
+    a child process starts with an empty pool. Inherited connections are
+    kept referenced but never used or closed in the child, since closing
+    them would release the parent's file locks.
+    """
+
+    def __init__(
+            self,
+            db_path: Path,
+            max_size: int,
+            wal_mode: bool = True,
+            timeout: float = _POOL_TIMEOUT
+    ) -> None:
+        self.db_path = db_path
+        self.max_size = max_size
+        self.wal_mode = wal_mode
+        self.timeout = timeout
+        self._inherited: list[sqlite3.Connection] = []
+        self._reset()
+
+    def _reset(self) -> None:
+        """ Start an empty pool owned by the current process."""
+        self._pid = os.getpid()
+        self._idle: queue.Queue[sqlite3.Connection] = queue.Queue(maxsize=self.max_size)
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _check_fork(self) -> None:
+        """ Abandon connections inherited from a parent process."""
+        if self._pid == os.getpid():
+            return
+        while True:
+            try:
+                self._inherited.append(self._idle.get_nowait())
+            except queue.Empty:
+                break
+        self._reset()
+
+    def _connect(self) -> sqlite3.Connection:
+        """ Open and configure a new pooled connection."""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS,
+        )
+        conn.row_factory = sqlite3.Row # Access columns by name
+        conn.execute("PRAGMA foreign_keys = ON") # Enforce foreign key constraints
+        if self.wal_mode:
+            conn.execute("PRAGMA journal_mode = WAL") # Readers don't block the writer
+            conn.execute("PRAGMA synchronous = NORMAL") # No fsync per commit in WAL mode
+        else:
+            conn.execute("PRAGMA journal_mode = DELETE") # WAL persists in the file; switch back
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def get(self) -> sqlite3.Connection:
+        """
+        Take a connection from the pool.
+
+        Opens a new connection if the pool has not reached ``max_size``,
+        otherwise blocks until another caller returns one.
+
+        Raises:
+            TimeoutError: If no connection frees up within ``timeout`` seconds
+        """
+        self._check_fork()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._created < self.max_size:
+                self._created += 1
+                create = True
+            else:
+                create = False
+
+        if not create:
+            try:
+                return self._idle.get(timeout=self.timeout)
+            except queue.Empty:
+                raise TimeoutError(
+                    f"No pooled connection available after {self.timeout}s "
+                    f"(pool size {self.max_size}); nested get_db_connection() "
+                    f"calls can exhaust the pool"
+                ) from None
+
+        try:
+            return self._connect()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def put(self, conn: sqlite3.Connection) -> None:
+        """ Return a connection to the pool."""
+        if self._pid != os.getpid():
+            # Checked out before a fork; never reuse it in this process
+            self._check_fork()
+            self._inherited.append(conn)
+            return
+        self._idle.put(conn)
+
+    def close(self) -> None:
+        """
+        Close every idle connection in the pool.
+
+        Each connection runs PRAGMA optimize first, so tables it queried get
+        planner statistics (as SQLite recommends before closing).
+        """
+        self._check_fork()
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                conn.execute(_SQL_OPTIMIZE)
+            except sqlite3.Error:
+                logger.warning("PRAGMA optimize failed while closing pool", exc_info=True)
+            conn.close()
+            with self._lock:
+                self._created -= 1
+
+
+_POOL = ConnectionPool(config.db_path, config.db_pool_size, config.wal_mode)
+
+
 @contextmanager
 def get_db_connection() -> Generator[sqlite3.Connection, None, None]:
     """
-    Context manager for database connections.
+    Context manager for pooled database connections.
     
-    Automatically commits on success, rolls back on error, and always closes.
+    Automatically commits on success, rolls back on error (including
+    KeyboardInterrupt), and always returns the connection to the pool
+    with no open transaction.
     
     Usage:
         with get_db_connection() as conn:
@@ -93,9 +338,7 @@ def get_db_connection() -> Generator[sqlite3.Connection, None, None]:
     Yield:
         sqlite3.Connection withy Row factory enabled
     """
-    conn = sqlite3.connect(config.db_path)
-    conn.row_factory = sqlite3.Row # Access columns by name
-    conn.execute("PRAGMA foreign_keys = ON") # Enforce foreign key constraints
+    conn = _POOL.get()
     try:
         yield conn
         conn.commit()
@@ -103,7 +346,63 @@ def get_db_connection() -> Generator[sqlite3.Connection, None, None]:
         conn.rollback()
         raise
     finally:
-        conn.close()
+        if conn.in_transaction:
+            conn.rollback()
+        _POOL.put(conn)
+
+def close_db_pool() -> None:
+    """
+    Close all idle pooled connections.
+
+    Call on shutdown, or in tests before removing the database file.
+    """
+    _POOL.close()
+
+# ---------------------- Statistics Cache -----------------
+
+_stats_cache: TTLCache = TTLCache(maxsize=16, ttl=_STATS_CACHE_TTL)
+_stats_cache_lock = threading.Lock()
+
+# Bumped on every write; part of the cache key, so a read that started
+# before a write is stored under a stale key and never served afterwards
+_stats_cache_version = 0
+
+def _stats_key(name: str) -> tuple:
+    """ Cache key for a statistics query at the current write version."""
+    return hashkey(name, _stats_cache_version)
+
+def _stats_cached(func):
+    """
+    Memoize a no-argument counting query in the shared TTL cache.
+
+    Callers get a deep copy, so mutating a result never leaks into the cache.
+    """
+    cached_func = cached(
+        _stats_cache,
+        key=partial(_stats_key, func.__name__),
+        lock=_stats_cache_lock
+    )(func)
+
+    @wraps(func)
+    def wrapper():
+        return copy.deepcopy(cached_func())
+
+    return wrapper
+
+def _invalidate_stats_cache() -> None:
+    """ Drop cached counts/statistics after a write."""
+    global _stats_cache_version
+    with _stats_cache_lock:
+        _stats_cache_version += 1
+        _stats_cache.clear()
+
+# ---------------------- Batching -------------------------
+
+def _chunked(rows: Iterable, size: int) -> Iterator[list]:
+    """ Yield successive lists of up to ``size`` items without materializing ``rows``."""
+    it = iter(rows)
+    while chunk := list(islice(it, size)):
+        yield chunk
 
 # ---------------------- Schema Management -------------------
 
@@ -120,10 +419,12 @@ def init_db() -> None:
         # Execute schema
         cursor.executescript(SCHEMA_SQL)
 
-        # Set schema version if not set
-        cursor.execute("SELECT version FROM schema_version WHERE version = ?", (CURRENT_SCHEMA_VERSION,))
-        if cursor.fetchone() is None:
-            cursor.execute("INSERT INTO schema_version (version) VALUES (?)", (CURRENT_SCHEMA_VERSION,))
+        # Cheap no-op unless statistics are stale or missing
+        cursor.execute(_SQL_OPTIMIZE_ALL_TABLES)
+
+        # Set schema version if not set (PRIMARY KEY makes this a no-op otherwise)
+        cursor.execute(_SQL_INSERT_SCHEMA_VERSION, (CURRENT_SCHEMA_VERSION,))
+        if cursor.rowcount == 1:
             logger.info(f"Initialized database with schema version {CURRENT_SCHEMA_VERSION}")
         else:
             logger.info(f"Database already at schema version {CURRENT_SCHEMA_VERSION}")
@@ -138,7 +439,7 @@ def get_schema_version() -> int | None:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT MAX(version) FROM schema_version")
+            cursor.execute(_SQL_MAX_SCHEMA_VERSION)
             row = cursor.fetchone()
             return row[0] if row else None
     except sqlite3.OperationalError:
@@ -169,13 +470,41 @@ def insert_response_pair(
     with get_db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
-            """
-            INSERT INTO response_pairs (pair_id, chosen, rejected, source_dataset)
-            VALUES (?, ?, ?, ?)
-            """,
+            _SQL_INSERT_PAIR,
             (pair_id, chosen, rejected, source_dataset)
         )
         logger.debug(f"Inserted response pair: {pair_id}")
+    _invalidate_stats_cache()
+
+def insert_response_pairs_bulk(rows: Iterable[tuple[str, str, str, str]]) -> int:
+    """
+    Insert many response pairs atomically, streaming them in chunks.
+
+    Rows are consumed lazily (generators are fine) and written
+    ``config.checkpoint_interval`` at a time inside a single transaction,
+    so either every row is inserted or none is.
+
+    Args:
+        rows: Iterable of (pair_id, chosen, rejected, source_dataset) tuples
+
+    Returns:
+        Number of pairs inserted
+
+    Raise:
+        sqlite3.IntegrityError: If any pair_id already exists (nothing is inserted)
+    """
+    inserted = 0
+    with get_db_connection() as conn:
+        conn.execute("BEGIN")
+        cursor = conn.cursor()
+        for chunk in _chunked(rows, config.checkpoint_interval):
+            cursor.executemany(_SQL_INSERT_PAIR, chunk)
+            inserted += len(chunk)
+        conn.commit()
+        conn.execute(_SQL_OPTIMIZE_ALL_TABLES)
+        logger.debug(f"Inserted {inserted} response pairs")
+    _invalidate_stats_cache()
+    return inserted
 
 
 
@@ -193,7 +522,7 @@ def get_response_pair(pair_id: str) -> sqlite3.Row | None:
     with get_db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
-            "SELECT * FROM response_pairs WHERE pair_id = ?",
+            _SQL_GET_PAIR,
             (pair_id,)
         )
         return cursor.fetchone()
@@ -207,23 +536,66 @@ def get_all_pair_ids() -> list[str]:
     """
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT pair_id FROM response_pairs ORDER by created_at")
+        cursor.execute(_SQL_GET_ALL_PAIR_IDS)
         return [row[0] for row in cursor.fetchall()]
     
+@_stats_cached
 def count_response_pairs() -> int:
     """
     Count total response pairs in database.
 
+    Cached for a few seconds; writes through this module invalidate it.
+
     Returns:
         Number of response pairs
     """
     with get_db_connection() as conn:
         cursor =conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM response_pairs")
+        cursor.execute(_SQL_COUNT_PAIRS)
         return cursor.fetchone()[0]
     
 # ------------------- Detection Operations --------------------
 
+def _json_default(obj: object) -> object:
+    """ Encode float subclasses and NumPy values neither encoder handles natively."""
+    if isinstance(obj, float):
+        return float(obj)
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def _needs_stdlib_json(obj: object) -> bool:
+    """ True if obj holds values orjson would alter (NaN/inf -> null) or reject (huge ints)."""
+    if obj is None or isinstance(obj, (str, bool)):
+        return False
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, int):
+        return not _ORJSON_INT_MIN <= obj <= _ORJSON_INT_MAX
+    if isinstance(obj, dict):
+        return any(_needs_stdlib_json(k) or _needs_stdlib_json(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return any(_needs_stdlib_json(item) for item in obj)
+    if hasattr(obj, "dtype") and hasattr(obj, "tolist"):
+        # NumPy scalar or array
+        return _needs_stdlib_json(obj.tolist())
+    return False
+
+def _dump_metadata(metadata: dict | None) -> str | None:
+    """
+    Serialize detection metadata to a JSON string (None if empty).
+
+    Uses orjson (with NumPy and non-str key support) for the common case.
+    Payloads containing NaN, infinity or ints beyond 64 bits go through
+    json.dumps instead, which keeps them intact (as NaN/Infinity tokens and
+    arbitrary-precision ints) where orjson would write null or raise.
+    """
+    if not metadata:
+        return None
+    if _needs_stdlib_json(metadata):
+        return json.dumps(metadata, default=_json_default)
+    return orjson.dumps(metadata, default=_json_default, option=_ORJSON_OPTIONS).decode()
+
 def insert_detection(
         pair_id: str,
         signal_type: str,
@@ -254,20 +626,59 @@ def insert_detection(
     if not 0.0 <= severity <= 1.0:
         raise ValueError(f"Severity must be between 0.0 and 1.0, got {severity}")
     
-    metadata_json = json.dumps(metadata) if metadata else None
+    metadata_json = _dump_metadata(metadata)
 
     with get_db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
-            """
-            INSERT INTO detections (pair_id, signal_type, severity, metadata)
-            VALUES (?, ?, ?, ?)
-            """,
+            _SQL_INSERT_DETECTION,
             (pair_id, signal_type, severity, metadata_json)
         )
         detection_id = cursor.lastrowid
         logger.debug(f"Inserted detection {detection_id}: {signal_type} for {pair_id}")
-        return detection_id
+    _invalidate_stats_cache()
+    return detection_id
+
+def insert_detections_bulk(rows: Iterable[tuple[str, str, float, dict | None]]) -> int:
+    """
+    Insert many detection results atomically, streaming them in chunks.
+
+    Rows are consumed lazily (generators are fine) and written
+    ``config.checkpoint_interval`` at a time inside a single transaction,
+    so either every row is inserted or none is.
+
+    Args:
+        rows: Iterable of (pair_id, signal_type, severity, metadata) tuples
+
+    Returns:
+        Number of detections inserted
+
+    Raises:
+        sqlite3.IntegrityError: If any pair_id doesn't exist (nothing is inserted)
+        ValueError: If any severity not in [0.0, 1.0] (nothing is inserted)
+    """
+    inserted = 0
+    with get_db_connection() as conn:
+        conn.execute("BEGIN")
+        cursor = conn.cursor()
+        for chunk in _chunked(rows, config.checkpoint_interval):
+            invalid = [severity for _, _, severity, _ in chunk if not 0.0 <= severity <= 1.0]
+            if invalid:
+                raise ValueError(f"Severity must be between 0.0 and 1.0, got {invalid[0]}")
+
+            cursor.executemany(
+                _SQL_INSERT_DETECTION,
+                (
+                    (pair_id, signal_type, severity, _dump_metadata(metadata))
+                    for pair_id, signal_type, severity, metadata in chunk
+                )
+            )
+            inserted += len(chunk)
+        conn.commit()
+        conn.execute(_SQL_OPTIMIZE_ALL_TABLES)
+        logger.debug(f"Inserted {inserted} detections")
+    _invalidate_stats_cache()
+    return inserted
     
 def get_detections_for_pair(pair_id: str) -> list[sqlite3.Row]:
     """
@@ -282,11 +693,7 @@ def get_detections_for_pair(pair_id: str) -> list[sqlite3.Row]:
     with get_db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
-            """
-            SELECT * FROM detections
-            WHERE pair_id = ?
-            ORDER BY severity DESC, detected_at
-            """,
+            _SQL_GET_DETECTIONS_FOR_PAIR,
             (pair_id,)
         ) 
         return cursor.fetchall()
@@ -305,11 +712,7 @@ def get_detections_by_signal(signal_type: str, min_severity:float = 0.0) -> list
     with get_db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
-            """
-            SELECT * FROM detections
-            WHERE signal_type = ? AND severity >= ?
-            ORDER BY severity DESC, detected_at
-            """,
+            _SQL_GET_DETECTIONS_BY_SIGNAL,
             (signal_type, min_severity)
         )
         return cursor.fetchall()
@@ -327,84 +730,59 @@ def get_high_severity_detections(min_severity: float = 0.9) -> list[sqlite3.Row]
     with get_db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
-            """
-            SELECT d.*, rp.chosen, rp.rejected
-            FROM detections d
-            JOIN response_pairs rp ON d.pair_id = rp.pair_id
-            WHERE d.severity >= ?
-            ORDER BY d.severity DESC, d.detected_at
-        """,
-        (min_severity,)        
+            _SQL_GET_HIGH_SEVERITY_DETECTIONS,
+            (min_severity,)
         )
         return cursor.fetchall()
     
+@_stats_cached
 def count_detections_by_signal() -> dict[str, int]:
     """
     Count detections grouped by signal type.
+
+    Cached for a few seconds; writes through this module invalidate it.
     
     Returns:
         Dict mapping signal_type to count
     """
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT signal_type, COUNT(*) as count
-            FROM detections
-            GROUP BY signal_type
-            ORDER BY count DESC
-        """
-        )
+        cursor.execute(_SQL_COUNT_DETECTIONS_BY_SIGNAL)
         return {row["signal_type"]: row["count"] for row in cursor.fetchall()}
     
+@_stats_cached
 def get_detection_statistics() -> dict:
     """
    Get summary of statistics about detections.
+
+    Cached for a few seconds; writes through this module invalidate it.
     
     Returns:
         Dict with statistics: total_detections, by_signal, avg_severity, etc.
     """
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute(
-            "SELECT COUNT(*) FROM detections"
-        )
-        total = cursor.fetchone()[0]
-
-        # By signal type
-        cursor.execute(
-            """
-            SELECT signal_type, COUNT(*) as count, AVG(severity) as avg_severity
-            FROM detections
-            GROUP by signal_type
-            """
-        )
-        by_signal ={
-            row["signal_type"]: {
-                "count": row["count"],
-                "avg_severity": round(row["avg_severity"], 3)
-            }
-            for row in cursor.fetchall()
-        }
-
-        # Severity distribution
-        cursor.execute(
-            """
-            SELECT
-                COUNT(CASE WHEN severity >= 0.9 THEN 1 END) as critical,
-                COUNT(CASE WHEN severity >= 0.7 AND severity < 0.9 THEN 1 END) as high,
-                COUNT(CASE WHEN severity >= 0.5 AND severity < 0.7 THEN 1 END) as medium,
-                COUNT(CASE WHEN severity < 0.5 THEN 1 END) as low
-            FROM detections
-            """
-        )
-        severity_dist = dict(cursor.fetchone())
-
-        return {
-            "total_detections": total,
-            "by_signal": by_signal,
-            "severity_distribution": severity_dist
+        # One scan: per-signal counts and severity buckets, totals summed below
+        cursor.execute(_SQL_DETECTION_STATISTICS)
+        rows = cursor.fetchall()
+
+    total = 0
+    by_signal = {}
+    severity_dist = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+    for row in rows:
+        total += row["count"]
+        by_signal[row["signal_type"]] = {
+            "count": row["count"],
+            "avg_severity": round(row["avg_severity"], 3)
         }
+        for level in severity_dist:
+            severity_dist[level] += row[level]
+
+    return {
+        "total_detections": total,
+        "by_signal": by_signal,
+        "severity_distribution": severity_dist
+    }
     
 # --------------------- Utility Functioins ----------------------
 
@@ -417,15 +795,19 @@ def clear_all_data() -> None:
     """
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("DELETE FROM detections")
-        cursor.execute("DELETE FROM response_pairs")
+        cursor.execute(_SQL_DELETE_DETECTIONS)
+        cursor.execute(_SQL_DELETE_PAIRS)
         logger.warning("Cleared all data from database")
+    _invalidate_stats_cache()
 
 def vacuum_db() -> None:
     """
     Optimize database by reclaiming unused space.
 
     Run periodically after large deletions to reduce file size.
+
+    VACUUM cannot run inside a transaction, so do not call this from
+    within another get_db_connection() block or an open BEGIN.
     """
     with get_db_connection() as conn:
         conn.execute("VACUUM")
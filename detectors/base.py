@@ -7,11 +7,12 @@ Base detector class for RLHF quality detection signals.
 from __future__ import annotations
 
 # -------------------- Standard Library ---------------
+import bisect
 import logging
 from abc import ABC, abstractmethod
 
 # ---------------- Third Party Library ---------------
-# N/A
+import numpy as np
 
 # ------------------ Application Import ---------------
 # N/A
@@ -19,6 +20,12 @@ from abc import ABC, abstractmethod
 # ------------------ Module Level Configuration ---------
 logger = logging.getLogger(__name__)
 
+# ------------------ Severity Levels ---------------
+# Lower bounds of medium/high/critical; a severity maps to the level at
+# index bisect_right(_SEVERITY_THRESHOLDS, severity)
+_SEVERITY_THRESHOLDS = (0.50, 0.70, 0.90)
+_SEVERITY_LEVELS = ("low", "medium", "high", "critical")
+
 class BaseDetector(ABC):
 
     @abstractmethod
@@ -36,11 +43,13 @@ class BaseDetector(ABC):
         """ Classifies the severity level """
         if not (0.0 <= severity <= 1.0):
             raise ValueError(f"Severity must be between 0.0 and 1.0,got {severity}")
-        if severity >= 0.90:
-            return "critical"
-        elif severity >= 0.70:
-            return "high"
-        elif severity >= 0.50:
-            return "medium"
-        else:
-            return "low"
\ No newline at end of file
+        return _SEVERITY_LEVELS[bisect.bisect_right(_SEVERITY_THRESHOLDS, severity)]
+
+    def get_severity_levels(self, severities: np.ndarray) -> np.ndarray:
+        """ Classifies an array of severities at once """
+        severities = np.asarray(severities)
+        out_of_range = ~((severities >= 0.0) & (severities <= 1.0))
+        if out_of_range.any():
+            raise ValueError(f"Severity must be between 0.0 and 1.0,got {severities[out_of_range][0]}")
+        indices = np.searchsorted(_SEVERITY_THRESHOLDS, severities, side="right")
+        return np.asarray(_SEVERITY_LEVELS)[indices]
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Persistent embedding cache for RLHF Data Quality System
+
+Stores sentence embeddings on disk keyed by a hash of the text, so repeated
+runs only encode texts they have not seen before.
+"""
+
+# -------------- Futures -------------
+
+from __future__ import annotations
+
+# -------------- Standard Library ---------
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+# ------------- Third Party Library ---------------
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+# -------------- Application Imports --------------
+
+from settings import get_config
+
+# -------------- Module-level Configuration -------
+
+config = get_config()
+logger = logging.getLogger(__name__)
+
+# -------------- Constants ------------------------
+
+_CACHE_FILENAME = "embeddings.db"
+
+# Stay under SQLite's default host-parameter limit for IN (...) lookups
+_LOOKUP_CHUNK_SIZE = 500
+
+_SQL_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key BLOB PRIMARY KEY,
+    vector BLOB NOT NULL
+)
+"""
+_SQL_INSERT_EMBEDDING = "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)"
+
+# -------------- Embedding Cache ------------------
+
+class EmbeddingCache:
+    """
+    Disk-backed text -> embedding cache for a single sentence transformer.
+
+    Keys are a 16-byte BLAKE2b digest of the model name, the device and
+    dtype of its weights (so FP16-on-CUDA and FP32-on-CPU vectors are kept
+    apart), the normalization flag and the text.
+
+    Safe to share across threads: the SQLite connection is guarded by a
+    lock, while model.encode runs outside it.
+
+    Usage:
+        cache = EmbeddingCache(model, "all-MiniLM-L6-v2")
+        embeddings = cache.encode_cached(["first text", "second text"])
+    """
+
+    def __init__(
+            self,
+            model: SentenceTransformer,
+            model_name: str,
+            path: Path | None = None
+    ) -> None:
+        self.model = model
+        self.model_name = model_name
+        self.path = path or config.cache_dir / _CACHE_FILENAME
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(_SQL_CREATE_TABLE)
+        self._lock = threading.Lock()
+
+    def _model_variant(self) -> str:
+        """ Device and dtype of the model weights, e.g. "cuda:torch.float16"."""
+        param = next(iter(self.model.parameters()), None)
+        if param is None:
+            return "unknown"
+        return f"{param.device.type}:{param.dtype}"
+
+    def _key(self, text: str, variant: str, normalize: bool) -> bytes:
+        """ Hash a text into its cache key."""
+        payload = f"{self.model_name}\0{variant}\0{int(normalize)}\0{text}".encode()
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def _lookup(self, keys: list[bytes]) -> dict[bytes, np.ndarray]:
+        """ Fetch cached vectors for the given keys."""
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), _LOOKUP_CHUNK_SIZE):
+                chunk = keys[start:start + _LOOKUP_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    chunk
+                )
+                for key, vector in cursor:
+                    found[key] = np.frombuffer(vector, dtype=np.float32)
+        return found
+
+    def encode_cached(self, texts: list[str], normalize_embeddings: bool = False) -> np.ndarray:
+        """
+        Encode texts, reusing cached embeddings where available.
+
+        Args:
+            texts: Texts to embed
+            normalize_embeddings: Return unit-length embeddings
+
+        Returns:
+            float32 array of shape (len(texts), embedding_dim)
+        """
+        if not texts:
+            dim = self.model.get_sentence_embedding_dimension()
+            return np.empty((0, dim), dtype=np.float32)
+
+        variant = self._model_variant()
+        keys = [self._key(text, variant, normalize_embeddings) for text in texts]
+        vectors = self._lookup(list(set(keys)))
+
+        misses = {key: text for key, text in zip(keys, texts) if key not in vectors}
+        if misses:
+            encoded = self.model.encode(
+                list(misses.values()),
+                batch_size=config.embedding_batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=normalize_embeddings
+            ).astype(np.float32)
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    _SQL_INSERT_EMBEDDING,
+                    ((key, vector.tobytes()) for key, vector in zip(misses, encoded))
+                )
+            vectors.update(zip(misses, encoded))
+            logger.debug(f"Encoded {len(misses)} uncached texts")
+
+        return np.stack([vectors[key] for key in keys])
+
+    def close(self) -> None:
+        """ Close the underlying cache database."""
+        with self._lock:
+            self._conn.close()
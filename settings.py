@@ -56,6 +56,17 @@ class AppConfig(BaseSettings):
         description="SQLite database path"
     )
 
+    db_pool_size: int = Field(
+        default = 8,
+        ge = 1,
+        description = "Maximum number of pooled SQLite connections"
+    )
+
+    wal_mode: bool = Field(
+        default = True,
+        description = "Use SQLite WAL journaling; when disabled, the database is switched to DELETE mode (e.g. in tests)"
+    )
+
     cache_dir: Path = Field(
         default=Path(".cache"),
         description="Cache directory for embeddings and checkpoints"
@@ -1,16 +1,22 @@
 #!usr/bin/env python3
 
+import torch
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 
-model = SentenceTransformer("all-MiniLM-L6-v2")
+from embedding_cache import EmbeddingCache
+
+device = "cuda" if torch.cuda.is_available() else "cpu"
+model = SentenceTransformer("all-MiniLM-L6-v2", device=device)
+if device == "cuda":
+    model.half() # FP16 halves memory traffic and uses tensor cores
+cache = EmbeddingCache(model, "all-MiniLM-L6-v2")
 
 def calculate_similarity(text1: str, text2: str) -> float:
-    embeddings = model.encode([text1, text2])
+    embeddings = cache.encode_cached([text1, text2], normalize_embeddings=True)
 
-    similarity = cosine_similarity([embeddings[0]], [embeddings[1]]) [0][0]
-    return similarity
+    # Unit-length embeddings: cosine similarity is a plain dot product
+    return float(embeddings[0] @ embeddings[1])
 
 if __name__ == "__main__":
 
@@ -0,0 +1,40 @@
+"""
+Shared fixtures for the RLHF Data Quality test suite.
+
+Points the application config at a throwaway database and cache directory
+before any application module is imported.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+_TMP_DIR = Path(tempfile.mkdtemp(prefix="rlhf-tests-"))
+
+os.environ["RLHF_ENV_NAME"] = "test"
+os.environ["RLHF_DB_PATH"] = str(_TMP_DIR / "rlhf.db")
+os.environ["RLHF_CACHE_DIR"] = str(_TMP_DIR / "cache")
+os.environ["RLHF_WAL_MODE"] = "false"
+os.environ["RLHF_CHECKPOINT_INTERVAL"] = "100"
+
+import pytest
+
+import database
+
+
+@pytest.fixture
+def db():
+    """ Initialized, empty database; wiped again after the test."""
+    database.init_db()
+    database.clear_all_data()
+    yield
+    database.clear_all_data()
+
+
+@pytest.fixture
+def pairs(db):
+    """ Database seeded with response pairs p0..p9."""
+    database.insert_response_pairs_bulk(
+        (f"p{i}", "chosen", "rejected", "hh-rlhf") for i in range(10)
+    )
+    return [f"p{i}" for i in range(10)]
@@ -0,0 +1,324 @@
+"""Tests for the database layer."""
+
+import json
+import math
+import os
+import sqlite3
+
+import pytest
+
+import database
+
+
+# ------------------- Connection Pool --------------------
+
+def test_pool_reuses_connections(db):
+    with database.get_db_connection() as first:
+        pass
+    with database.get_db_connection() as second:
+        pass
+    assert first is second
+
+
+def test_connection_rolls_back_on_error(db):
+    with pytest.raises(RuntimeError):
+        with database.get_db_connection() as conn:
+            conn.execute(database._SQL_INSERT_PAIR, ("p1", "c", "r", "hh"))
+            raise RuntimeError("boom")
+
+    assert database.get_response_pair("p1") is None
+    assert not conn.in_transaction
+
+
+def test_connection_rolls_back_on_keyboard_interrupt(db):
+    with pytest.raises(KeyboardInterrupt):
+        with database.get_db_connection() as conn:
+            conn.execute(database._SQL_INSERT_PAIR, ("p1", "c", "r", "hh"))
+            raise KeyboardInterrupt
+
+    assert not conn.in_transaction
+    database.insert_response_pair("p2", "c", "r", "hh")
+    assert database.get_response_pair("p1") is None
+    assert database.get_response_pair("p2") is not None
+
+
+def test_exhausted_pool_times_out(tmp_path):
+    pool = database.ConnectionPool(tmp_path / "pool.db", max_size=1, timeout=0.05)
+    conn = pool.get()
+    with pytest.raises(TimeoutError):
+        pool.get()
+    pool.put(conn)
+    assert pool.get() is conn
+    pool.put(conn)
+    pool.close()
+
+
+def test_pool_abandons_connections_inherited_across_fork(tmp_path):
+    pool = database.ConnectionPool(tmp_path / "pool.db", max_size=1, timeout=0.05)
+    parent_conn = pool.get()
+    pool.put(parent_conn)
+
+    pool._pid = -1  # Pretend the pool was filled by a parent process
+    child_conn = pool.get()
+
+    assert child_conn is not parent_conn
+    parent_conn.execute("SELECT 1")  # Left open, not closed by the child
+    pool.put(child_conn)
+    pool.close()
+    parent_conn.close()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_pool_usable_in_forked_child(db):
+    database.insert_response_pair("p1", "c", "r", "hh")
+    with database.get_db_connection() as parent_conn:
+        pass
+
+    pid = os.fork()
+    if pid == 0:
+        try:
+            with database.get_db_connection() as child_conn:
+                ok = child_conn is not parent_conn and database.get_response_pair("p1") is not None
+        except BaseException:
+            ok = False
+        os._exit(0 if ok else 1)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    with database.get_db_connection() as conn:
+        assert conn is parent_conn
+
+
+# ------------------- Detection Metadata --------------------
+
+def test_detection_metadata_numpy_and_int_keys(pairs):
+    np = pytest.importorskip("numpy")
+
+    class Score(float):
+        pass
+
+    metadata = {
+        "ratio": np.float64(3.5),
+        "length": np.int64(120),
+        "scores": np.array([0.25, 0.75]),
+        "weighted": Score(0.5),
+        1: "first turn",
+    }
+    database.insert_detection(pairs[0], "length_ratio", 0.8, metadata)
+
+    row = database.get_detections_for_pair(pairs[0])[0]
+    assert json.loads(row["metadata"]) == {
+        "ratio": 3.5,
+        "length": 120,
+        "scores": [0.25, 0.75],
+        "weighted": 0.5,
+        "1": "first turn",
+    }
+
+
+# ------------------- Bulk Inserts --------------------
+
+def test_bulk_insert_invalid_severity_writes_nothing(pairs):
+    rows = [(pairs[i % 10], "length_ratio", 0.5, None) for i in range(150)]
+    rows.append((pairs[0], "length_ratio", 1.5, None))
+
+    with pytest.raises(ValueError):
+        database.insert_detections_bulk(rows)
+    assert database.count_detections_by_signal() == {}
+
+
+def test_bulk_insert_foreign_key_failure_writes_nothing(pairs):
+    rows = [(pairs[i % 10], "length_ratio", 0.5, None) for i in range(150)]
+    rows.append(("missing", "length_ratio", 0.5, None))
+
+    with pytest.raises(sqlite3.IntegrityError):
+        database.insert_detections_bulk(rows)
+    assert database.count_detections_by_signal() == {}
+
+
+def test_bulk_insert_duplicate_pair_writes_nothing(pairs):
+    with pytest.raises(sqlite3.IntegrityError):
+        database.insert_response_pairs_bulk([("new", "c", "r", "hh"), (pairs[0], "c", "r", "hh")])
+    assert database.get_response_pair("new") is None
+    assert database.count_response_pairs() == 10
+
+
+# ------------------- Statistics --------------------
+
+def _legacy_detection_statistics() -> dict:
+    """ The original three-query implementation of get_detection_statistics."""
+    with database.get_db_connection() as conn:
+        total = conn.execute("SELECT COUNT(*) FROM detections").fetchone()[0]
+        by_signal = {
+            row["signal_type"]: {
+                "count": row["count"],
+                "avg_severity": round(row["avg_severity"], 3)
+            }
+            for row in conn.execute(
+                """
+                SELECT signal_type, COUNT(*) as count, AVG(severity) as avg_severity
+                FROM detections
+                GROUP by signal_type
+                """
+            )
+        }
+        severity_dist = dict(conn.execute(
+            """
+            SELECT
+                COUNT(CASE WHEN severity >= 0.9 THEN 1 END) as critical,
+                COUNT(CASE WHEN severity >= 0.7 AND severity < 0.9 THEN 1 END) as high,
+                COUNT(CASE WHEN severity >= 0.5 AND severity < 0.7 THEN 1 END) as medium,
+                COUNT(CASE WHEN severity < 0.5 THEN 1 END) as low
+            FROM detections
+            """
+        ).fetchone())
+    return {
+        "total_detections": total,
+        "by_signal": by_signal,
+        "severity_distribution": severity_dist
+    }
+
+
+def test_detection_statistics_empty(db):
+    assert database.get_detection_statistics() == _legacy_detection_statistics()
+
+
+def test_detection_statistics_match_legacy_queries(pairs):
+    severities = [0.0, 0.2, 0.5, 0.65, 0.7, 0.85, 0.9, 1.0]
+    database.insert_detections_bulk(
+        (pairs[i % 10], signal, severity, None)
+        for i, severity in enumerate(severities)
+        for signal in ("length_ratio", "repetition")
+    )
+    database.insert_detection(pairs[0], "semantic_duplicate", 0.95)
+
+    stats = database.get_detection_statistics()
+    assert stats == _legacy_detection_statistics()
+    assert stats["total_detections"] == 17
+    assert stats["severity_distribution"] == {"critical": 5, "high": 4, "medium": 4, "low": 4}
+
+
+# ------------------- Streaming Bulk Inserts --------------------
+
+def test_bulk_insert_streams_multiple_chunks(db):
+    rows = ((f"p{i}", "c", "r", "hh") for i in range(250))
+    assert database.insert_response_pairs_bulk(rows) == 250
+
+    detections = ((f"p{i}", "length_ratio", 0.5, {"i": i}) for i in range(250))
+    assert database.insert_detections_bulk(detections) == 250
+    assert database.count_detections_by_signal() == {"length_ratio": 250}
+
+
+# ------------------- Statistics Cache --------------------
+
+def test_stats_cache_invalidated_by_writes(pairs):
+    assert database.count_response_pairs() == 10
+    assert database.count_detections_by_signal() == {}
+
+    database.insert_response_pair("extra", "c", "r", "hh")
+    assert database.count_response_pairs() == 11
+
+    database.insert_detection(pairs[0], "repetition", 0.4)
+    assert database.count_detections_by_signal() == {"repetition": 1}
+
+    database.insert_detections_bulk([(pairs[1], "repetition", 0.9, None)])
+    assert database.count_detections_by_signal() == {"repetition": 2}
+    assert database.get_detection_statistics()["total_detections"] == 2
+
+    database.clear_all_data()
+    assert database.count_response_pairs() == 0
+    assert database.get_detection_statistics()["total_detections"] == 0
+
+
+def test_stats_cache_results_are_copies(pairs):
+    database.insert_detection(pairs[0], "repetition", 0.4)
+
+    counts = database.count_detections_by_signal()
+    counts["repetition"] = 99
+    stats = database.get_detection_statistics()
+    stats["by_signal"]["repetition"]["count"] = 99
+
+    assert database.count_detections_by_signal() == {"repetition": 1}
+    assert database.get_detection_statistics()["by_signal"]["repetition"]["count"] == 1
+
+
+def test_stats_cache_ignores_results_from_before_a_write(pairs):
+    stale_key = database._stats_key("count_response_pairs")
+    database.insert_response_pair("extra", "c", "r", "hh")
+
+    # A read that began before the write stores its result late
+    database._stats_cache[stale_key] = 10
+    assert database.count_response_pairs() == 11
+
+
+# ------------------- Schema --------------------
+
+def test_init_db_is_idempotent(db):
+    database.init_db()
+    assert database.get_schema_version() == database.CURRENT_SCHEMA_VERSION
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+def test_detection_metadata_keeps_non_finite_floats(pairs, value):
+    database.insert_detection(pairs[0], "length_ratio", 1.0, {"ratio": value, "n": 1})
+
+    stored = json.loads(database.get_detections_for_pair(pairs[0])[0]["metadata"])
+    if math.isnan(value):
+        assert math.isnan(stored["ratio"])
+    else:
+        assert stored["ratio"] == value
+    assert stored["n"] == 1
+
+
+def test_detection_metadata_keeps_non_finite_numpy_values(pairs):
+    np = pytest.importorskip("numpy")
+
+    metadata = {"scores": np.array([0.5, np.inf]), "ratio": np.float32("nan"), "n": np.int64(2)}
+    database.insert_detection(pairs[0], "length_ratio", 1.0, metadata)
+
+    stored = json.loads(database.get_detections_for_pair(pairs[0])[0]["metadata"])
+    assert stored["scores"] == [0.5, float("inf")]
+    assert math.isnan(stored["ratio"])
+    assert stored["n"] == 2
+
+
+@pytest.mark.parametrize("value", [2 ** 64, -(2 ** 63) - 1, 10 ** 30])
+def test_detection_metadata_keeps_big_ints(pairs, value):
+    database.insert_detection(pairs[0], "length_ratio", 0.5, {"count": value})
+
+    stored = json.loads(database.get_detections_for_pair(pairs[0])[0]["metadata"])
+    assert stored == {"count": value}
+
+
+def test_close_db_pool_collects_planner_statistics(pairs):
+    database.insert_detections_bulk(
+        (pairs[i % 10], "length_ratio", (i % 100) / 100, None) for i in range(500)
+    )
+    database.get_detections_by_signal("length_ratio", 0.5)
+    database.get_high_severity_detections()
+    database.close_db_pool()
+
+    conn = sqlite3.connect(database.config.db_path)
+    try:
+        indexes = {row[0] for row in conn.execute("SELECT idx FROM sqlite_stat1 WHERE tbl = 'detections'")}
+    finally:
+        conn.close()
+    assert {"idx_detections_signal_sev", "idx_detections_sev_desc"} <= indexes
+
+
+# ------------------- Journal Mode --------------------
+
+def test_wal_mode_setting_controls_journal_mode(tmp_path):
+    path = tmp_path / "journal.db"
+
+    wal_pool = database.ConnectionPool(path, max_size=1, wal_mode=True)
+    conn = wal_pool.get()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    wal_pool.put(conn)
+    wal_pool.close()
+
+    delete_pool = database.ConnectionPool(path, max_size=1, wal_mode=False)
+    conn = delete_pool.get()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    delete_pool.put(conn)
+    delete_pool.close()
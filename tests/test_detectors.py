@@ -0,0 +1,52 @@
+"""Tests for the detector base class."""
+
+import numpy as np
+import pytest
+
+from detectors.base import BaseDetector
+
+
+class _StubDetector(BaseDetector):
+
+    def detect(self, chosen: str, rejected: str) -> dict:
+        return {}
+
+    @property
+    def signal_type(self) -> str:
+        return "stub"
+
+
+@pytest.fixture
+def detector():
+    return _StubDetector()
+
+
+@pytest.mark.parametrize(
+    ("severity", "level"),
+    [
+        (0.0, "low"),
+        (0.49, "low"),
+        (0.5, "medium"),
+        (0.69, "medium"),
+        (0.7, "high"),
+        (0.89, "high"),
+        (0.9, "critical"),
+        (1.0, "critical"),
+    ],
+)
+def test_get_severity_level_boundaries(detector, severity, level):
+    assert detector.get_severity_level(severity) == level
+
+
+def test_get_severity_levels_matches_scalar(detector):
+    severities = np.linspace(0.0, 1.0, 101)
+    expected = [detector.get_severity_level(s) for s in severities]
+    assert detector.get_severity_levels(severities).tolist() == expected
+
+
+@pytest.mark.parametrize("severity", [-0.1, 1.1, float("nan")])
+def test_severity_out_of_range_raises(detector, severity):
+    with pytest.raises(ValueError):
+        detector.get_severity_level(severity)
+    with pytest.raises(ValueError):
+        detector.get_severity_levels(np.array([0.5, severity]))
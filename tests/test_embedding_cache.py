@@ -0,0 +1,99 @@
+"""Tests for the persistent embedding cache."""
+
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from embedding_cache import EmbeddingCache
+
+
+class _StubModel:
+    """ Minimal stand-in for SentenceTransformer that records encode calls."""
+
+    def __init__(self, dtype: str = "torch.float32", device: str = "cpu") -> None:
+        self.calls = []
+        self._param = SimpleNamespace(dtype=dtype, device=SimpleNamespace(type=device))
+
+    def parameters(self):
+        return iter([self._param])
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return 3
+
+    def encode(self, texts, normalize_embeddings=False, **kwargs):
+        self.calls.append(list(texts))
+        vectors = np.array([[len(text), 1.0, 2.0] for text in texts], dtype=np.float64)
+        if normalize_embeddings:
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "embeddings.db"
+
+
+def test_encode_cached_only_encodes_misses(cache_path):
+    model = _StubModel()
+    cache = EmbeddingCache(model, "stub", path=cache_path)
+
+    first = cache.encode_cached(["a", "bb", "a"])
+    second = cache.encode_cached(["bb", "ccc"])
+    cache.close()
+
+    assert model.calls == [["a", "bb"], ["ccc"]]
+    assert first.dtype == np.float32
+    np.testing.assert_array_equal(first[:, 0], [1, 2, 1])
+    np.testing.assert_array_equal(second[:, 0], [2, 3])
+
+
+def test_encode_cached_persists_across_instances(cache_path):
+    EmbeddingCache(_StubModel(), "stub", path=cache_path).encode_cached(["a"])
+
+    model = _StubModel()
+    cache = EmbeddingCache(model, "stub", path=cache_path)
+    cache.encode_cached(["a"])
+    cache.close()
+
+    assert model.calls == []
+
+
+def test_encode_cached_keys_on_settings(cache_path):
+    model = _StubModel()
+    cache = EmbeddingCache(model, "stub", path=cache_path)
+    cache.encode_cached(["a"])
+    normalized = cache.encode_cached(["a"], normalize_embeddings=True)
+    cache.close()
+
+    fp16 = _StubModel(dtype="torch.float16", device="cuda")
+    EmbeddingCache(fp16, "stub", path=cache_path).encode_cached(["a"])
+
+    assert model.calls == [["a"], ["a"]]
+    assert fp16.calls == [["a"]]
+    assert np.isclose(np.linalg.norm(normalized[0]), 1.0)
+
+
+def test_encode_cached_empty_batch(cache_path):
+    model = _StubModel()
+    cache = EmbeddingCache(model, "stub", path=cache_path)
+    result = cache.encode_cached([])
+    cache.close()
+
+    assert result.shape == (0, 3)
+    assert result.dtype == np.float32
+    assert model.calls == []
+
+
+def test_encode_cached_from_other_threads(cache_path):
+    model = _StubModel()
+    cache = EmbeddingCache(model, "stub", path=cache_path)
+    cache.encode_cached(["a"])
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda i: cache.encode_cached(["a", f"text-{i}"]), range(8)))
+    cache.close()
+
+    assert all(result.shape == (2, 3) for result in results)
+    assert all(result[0, 0] == 1 for result in results)